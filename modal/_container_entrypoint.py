@@ -216,7 +216,8 @@ def call_function(
                     api_pb2.DATA_FORMAT_GENERATOR_DONE,
                 )
             else:
-                if not inspect.iscoroutine(res) or inspect.isgenerator(res) or inspect.isasyncgen(res):
+                # A coroutine is never a (async) generator, so this single check covers both
+                if not inspect.iscoroutine(res):
                     raise InvalidError(
                         f"Async (non-generator) function returned value of type {type(res)}"
                         " You might need to use @app.function(..., is_generator=True)."
@@ -109,7 +109,9 @@ class LineBufferedOutput(io.StringIO):
             # Prepend cursor up + carriage return.
             remainder = "\x1b[1A\r" + remainder
 
-        self._callback(completed_lines)
+        # Chunks without a line break only extend the buffer, so there's nothing to write out yet.
+        if completed_lines:
+            self._callback(completed_lines)
         self._buf = remainder
 
     def flush(self):
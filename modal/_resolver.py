@@ -100,11 +100,15 @@ class Resolver:
                 self._local_uuid_to_future[obj.local_uuid] = fut
             return obj
 
+        cached_future = self._local_uuid_to_future.get(obj.local_uuid)
+
         deduplication_key: Optional[Hashable] = None
-        if obj._deduplication_key:
+        if not cached_future and obj._deduplication_key:
+            # computing the key can be expensive (e.g. listing all files of a mount),
+            # so only do it for objects this resolver hasn't seen yet
             deduplication_key = await obj._deduplication_key()
-
-        cached_future = self._local_uuid_to_future.get(obj.local_uuid)
+            # the same object may have started loading while we were awaiting the key
+            cached_future = self._local_uuid_to_future.get(obj.local_uuid)
 
         if not cached_future and deduplication_key is not None:
             # deduplication cache makes sure duplicate mounts are resolved only
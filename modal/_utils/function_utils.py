@@ -228,11 +228,13 @@ class FunctionInfo:
 
     def get_cls_vars(self) -> dict[str, Any]:
         if self.user_cls is not None:
-            cls_vars = {
-                attr: getattr(self.user_cls, attr)
-                for attr in dir(self.user_cls)
-                if not callable(getattr(self.user_cls, attr)) and not attr.startswith("__")
-            }
+            cls_vars = {}
+            for attr in dir(self.user_cls):
+                if attr.startswith("__"):
+                    continue
+                value = getattr(self.user_cls, attr)
+                if not callable(value):
+                    cls_vars[attr] = value
             return cls_vars
         return {}
 
@@ -2,6 +2,7 @@
 import inspect
 import os
 import typing
+import weakref
 from collections.abc import Collection
 from typing import Any, Callable, Optional, TypeVar, Union
 
@@ -47,7 +48,18 @@ def _use_annotation_parameters(user_cls: type) -> bool:
     return has_parameters and not has_explicit_constructor
 
 
+# Constructor signatures are derived once per class and reused for every parameter binding.
+# Weakly keyed so that dynamically created classes can still be garbage collected.
+_class_constructor_signatures: "weakref.WeakKeyDictionary[type, inspect.Signature]" = weakref.WeakKeyDictionary()
+
+
 def _get_class_constructor_signature(user_cls: type) -> inspect.Signature:
+    if user_cls not in _class_constructor_signatures:
+        _class_constructor_signatures[user_cls] = _build_class_constructor_signature(user_cls)
+    return _class_constructor_signatures[user_cls]
+
+
+def _build_class_constructor_signature(user_cls: type) -> inspect.Signature:
     if not _use_annotation_parameters(user_cls):
         return inspect.signature(user_cls)
     else:
@@ -1,5 +1,6 @@
 # Copyright Modal Labs 2022
 import contextlib
+import functools
 import json
 import os
 import re
@@ -118,10 +119,15 @@ def _dockerhub_python_version(builder_version: ImageBuilderVersion, python_versi
     return f"{python_series_requested}.{micro_version}"
 
 
-def _base_image_config(group: str, builder_version: ImageBuilderVersion) -> Any:
+@functools.lru_cache(maxsize=1)
+def _load_base_image_config() -> dict[str, Any]:
+    # The file ships with the client, so it only needs to be read once per process
     with open(LOCAL_REQUIREMENTS_DIR / "base-images.json") as f:
-        data = json.load(f)
-    return data[group][builder_version]
+        return json.load(f)
+
+
+def _base_image_config(group: str, builder_version: ImageBuilderVersion) -> Any:
+    return _load_base_image_config()[group][builder_version]
 
 
 def _get_modal_requirements_path(builder_version: ImageBuilderVersion, python_version: Optional[str] = None) -> str:
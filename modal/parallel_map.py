@@ -39,10 +39,10 @@ class _SynchronizedQueue:
     """mdmd:hidden"""
 
     # small wrapper around asyncio.Queue to make it cross-thread compatible through synchronicity
-    async def init(self):
+    async def init(self, maxsize: int = 0):
         # in Python 3.8 the asyncio.Queue is bound to the event loop on creation
         # so it needs to be created in a synchronicity-wrapped init method
-        self.q = asyncio.Queue()
+        self.q = asyncio.Queue(maxsize=maxsize)
 
     @synchronizer.no_io_translation
     async def put(self, item):
@@ -63,6 +63,7 @@ class _OutputValue:
 
 
 MAP_INVOCATION_CHUNK_SIZE = 49
+MAP_INVOCATION_INPUT_QUEUE_SIZE = 2 * MAP_INVOCATION_CHUNK_SIZE
 
 if typing.TYPE_CHECKING:
     import modal.functions
@@ -98,7 +99,9 @@ async def _map_invocation(
     pending_outputs: dict[str, int] = {}  # Map input_id -> next expected gen_index value
     completed_outputs: set[str] = set()  # Set of input_ids whose outputs are complete (expecting no more values)
 
-    input_queue: asyncio.Queue = asyncio.Queue()
+    # Bounded (like raw_input_queue) so that serializing/uploading inputs runs ahead of FunctionPutInputs
+    # by at most a couple of batches, instead of buffering every input while the server applies backpressure
+    input_queue: asyncio.Queue = asyncio.Queue(maxsize=MAP_INVOCATION_INPUT_QUEUE_SIZE)
 
     async def create_input(argskwargs):
         nonlocal num_inputs
@@ -331,7 +334,7 @@ async def _map_async(
     prefer: throughput (prioritize queueing inputs) or latency (prioritize yielding results)
     """
     raw_input_queue: Any = SynchronizedQueue()  # type: ignore
-    raw_input_queue.init()
+    raw_input_queue.init(MAP_INVOCATION_INPUT_QUEUE_SIZE)  # throttles the input iterator
 
     async def feed_queue():
         # This runs in a main thread event loop, so it doesn't block the synchronizer loop
@@ -382,7 +385,7 @@ async def _starmap_async(
     return_exceptions: bool = False,
 ) -> typing.AsyncIterable[Any]:
     raw_input_queue: Any = SynchronizedQueue()  # type: ignore
-    raw_input_queue.init()
+    raw_input_queue.init(MAP_INVOCATION_INPUT_QUEUE_SIZE)  # throttles the input iterator
 
     async def feed_queue():
         # This runs in a main thread event loop, so it doesn't block the synchronizer loop
@@ -912,6 +912,27 @@ def test_implicit_constructor():
     assert function_info.class_parameter_info().format == api_pb2.ClassParameterInfo.PARAM_SERIALIZATION_FORMAT_PROTO
 
 
+def test_implicit_constructor_signature_reused():
+    from modal.cls import _get_class_constructor_signature
+
+    user_cls = synchronizer._translate_in(UsingAnnotationParameters)._user_cls  # type: ignore
+    signature = _get_class_constructor_signature(user_cls)
+
+    c = synchronizer._translate_in(UsingAnnotationParameters(a=10))  # type: ignore
+    assert c._get_parameter_values() == {"a": 10, "b": "hello"}
+    d = synchronizer._translate_in(UsingAnnotationParameters(a=11, b="goodbye"))  # type: ignore
+    assert d._get_parameter_values() == {"a": 11, "b": "goodbye"}
+    assert _get_class_constructor_signature(user_cls) is signature
+
+    # binding is still validated against the cached signature
+    e = synchronizer._translate_in(UsingAnnotationParameters(b="goodbye"))  # type: ignore
+    with pytest.raises(TypeError, match="missing a required argument: 'a'"):
+        e._get_parameter_values()
+    f = synchronizer._translate_in(UsingAnnotationParameters(a=1, c=2.0))  # type: ignore
+    with pytest.raises(TypeError, match="unexpected keyword argument 'c'"):
+        f._get_parameter_values()
+
+
 def test_custom_constructor():
     d = UsingCustomConstructor(10)
     assert not init_side_effects
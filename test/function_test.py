@@ -7,14 +7,17 @@ import time
 import typing
 from contextlib import contextmanager
 
+from grpclib import GRPCError, Status
 from synchronicity.exceptions import UserCodeException
 
 import modal
 from modal import App, Image, NetworkFileSystem, Proxy, asgi_app, batched, web_endpoint
 from modal._utils.async_utils import synchronize_api
+from modal._utils.blob_utils import BLOB_MAX_PARALLELISM
 from modal._vendor import cloudpickle
 from modal.exception import DeprecationError, ExecutionError, InvalidError
 from modal.functions import Function, FunctionCall, gather
+from modal.parallel_map import MAP_INVOCATION_CHUNK_SIZE, MAP_INVOCATION_INPUT_QUEUE_SIZE
 from modal.runner import deploy_app
 from modal_proto import api_pb2
 
@@ -75,6 +78,56 @@ def test_map(client, servicer, slow_put_inputs):
         assert len(servicer.cleared_function_calls) == 2
 
 
+@pytest.mark.asyncio
+async def test_map_backpressure_throttles_input_iterator(client, servicer):
+    app = App()
+    dummy_modal = app.function()(dummy)
+
+    n_yielded = 0
+
+    def input_gen():
+        nonlocal n_yielded
+        for i in range(10_000):
+            n_yielded += 1
+            yield i
+
+    n_put_inputs_calls = 0
+    put_inputs_retried = asyncio.Event()
+
+    async def put_inputs_exhausted(servicer, stream):
+        nonlocal n_put_inputs_calls
+        await stream.recv_message()
+        n_put_inputs_calls += 1
+        if n_put_inputs_calls >= 2:
+            put_inputs_retried.set()
+        raise GRPCError(Status.RESOURCE_EXHAUSTED, "function backlog is full")
+
+    async def consume():
+        async for _ in dummy_modal.map.aio(input_gen()):
+            pass
+
+    async def wait_for_iterator_to_stall():
+        last_n_yielded = -1
+        while n_yielded != last_n_yielded:
+            last_n_yielded = n_yielded
+            await asyncio.sleep(0.05)
+
+    with servicer.intercept() as ctx:
+        ctx.set_responder("FunctionPutInputs", put_inputs_exhausted)
+        async with app.run(client=client):
+            consume_task = asyncio.create_task(consume())
+            await asyncio.wait_for(put_inputs_retried.wait(), timeout=10)
+            await asyncio.wait_for(wait_for_iterator_to_stall(), timeout=10)
+            consume_task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await consume_task
+
+    # While no inputs can be pushed, the iterator only runs ahead by what fits in the two bounded
+    # queues, the batch being (re)sent, the inputs being serialized, and a few items in transit
+    max_buffered = 2 * MAP_INVOCATION_INPUT_QUEUE_SIZE + (MAP_INVOCATION_CHUNK_SIZE + 1) + BLOB_MAX_PARALLELISM
+    assert MAP_INVOCATION_CHUNK_SIZE <= n_yielded <= max_buffered + 5
+
+
 @pytest.mark.asyncio
 async def test_map_async_generator(client):
     app = App()
@@ -0,0 +1,31 @@
+# Copyright Modal Labs 2024
+from unittest import mock
+
+from modal._output import LineBufferedOutput
+
+
+def test_line_buffered_output_waits_for_line_break():
+    callback = mock.Mock()
+    stream = LineBufferedOutput(callback)
+
+    stream.write("hello ")
+    stream.write("world")
+    callback.assert_not_called()
+
+    stream.write("!\nnext")
+    callback.assert_called_once_with("hello world!\n")
+
+    stream.finalize()
+    assert callback.call_args_list == [mock.call("hello world!\n"), mock.call("next")]
+
+
+def test_line_buffered_output_carriage_return():
+    callback = mock.Mock()
+    stream = LineBufferedOutput(callback)
+
+    stream.write("50%\r")
+    callback.assert_called_once_with("50%\n")
+
+    # the partial line is rewritten in place by moving the cursor back up
+    stream.write("100%\n")
+    assert callback.call_args_list == [mock.call("50%\n"), mock.call("\x1b[1A\r100%\n")]
@@ -4,7 +4,9 @@ import pytest
 import time
 from typing import Optional
 
+import modal.mount
 from modal._resolver import Resolver
+from modal.mount import _Mount
 from modal.object import _Object
 
 
@@ -61,3 +63,26 @@ def test_resolver_without_rich(no_rich, client):
     resolver.add_status_row()
     with resolver.display():
         pass
+
+
+@pytest.mark.asyncio
+async def test_shared_mount_lists_files_once_per_resolver(client, tmp_path_with_content, monkeypatch):
+    select_files_calls = 0
+    original_select_files = modal.mount._select_files
+
+    def counting_select_files(entries):
+        nonlocal select_files_calls
+        select_files_calls += 1
+        return original_select_files(entries)
+
+    monkeypatch.setattr(modal.mount, "_select_files", counting_select_files)
+
+    resolver = Resolver(client, environment_name="", app_id=None)
+    mount = _Mount.from_local_dir(tmp_path_with_content, remote_path="/data")
+    await resolver.load(mount)
+    calls_after_first_load = select_files_calls
+    assert calls_after_first_load > 0
+
+    # e.g. several functions depending on the same mount instance
+    await asyncio.gather(resolver.load(mount), resolver.load(mount))
+    assert select_files_calls == calls_after_first_load